@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from collections import OrderedDict
+from typing import TypeVar, cast
 
 import dotenv
 from langchain.globals import set_llm_cache
@@ -14,6 +17,7 @@ from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
 
 from app.logging import get_logger
+from app.metrics import llm_cache_hits_total
 
 logger = get_logger(__name__)
 
@@ -52,6 +56,13 @@ class LangchainLLM(LLMProvider):
     - Plain text: await generate("...prompt...")
     - Structured: await generate_structured("...prompt...", MySchema)
 
+    Structured results are memoized in a small in-process LRU keyed by a
+    blake2b digest of (schema, prompt). It is a second tier in front of the
+    SQLiteCache set above (which already avoids repeat network calls): a hit
+    skips the SQLite lookup and re-parsing the response into the schema.
+    Concurrent identical requests share a single in-flight call instead of
+    each hitting the model.
+
     Env:
       OPENAI_API_KEY must be set if using OpenAI models.
     """
@@ -59,6 +70,7 @@ class LangchainLLM(LLMProvider):
     def __init__(
         self,
         model: str = "gpt-4o-mini",
+        structured_cache_size: int = 256,
     ) -> None:
         api_key = os.getenv("OPENAI_API_KEY")
         base_url = os.getenv("OPENAI_BASE_URL")
@@ -74,6 +86,9 @@ class LangchainLLM(LLMProvider):
 
         self.llm = ChatOpenAI(**chat_kwargs)
         self._prompt = ChatPromptTemplate.from_messages([("user", "{input}")])
+        self._structured_cache: OrderedDict[str, BaseModel] = OrderedDict()
+        self._structured_cache_size = structured_cache_size
+        self._structured_inflight: dict[str, asyncio.Task[BaseModel]] = {}
 
         # Lowered to debug to avoid noisy logs when multiple instances are constructed
         logger.debug("LangChain LLM 초기화 완료", model=model, provider="OpenAI")
@@ -102,10 +117,67 @@ class LangchainLLM(LLMProvider):
 
         return result
 
+    @staticmethod
+    def _structured_cache_key(prompt: str, schema: type[BaseModel]) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{schema.__module__}.{schema.__qualname__}".encode())
+        digest.update(prompt.encode("utf-8"))
+        return digest.hexdigest()
+
     async def generate_structured(self, prompt: str, schema: type[T]) -> T:
         """
         Return a Pydantic-validated object using LangChain's structured output.
         """
+        cache_key = self._structured_cache_key(prompt, schema)
+        cached = self._structured_cache.get(cache_key)
+        if cached is not None:
+            self._structured_cache.move_to_end(cache_key)
+            llm_cache_hits_total.labels(model=self.model, schema=schema.__name__).inc()
+            logger.debug(
+                "구조화된 생성 캐시 적중",
+                model=self.model,
+                schema=schema.__name__,
+                cache_key=cache_key[:8],
+            )
+            # Hand out a copy so callers can't mutate the cached instance
+            return cast(T, cached.model_copy(deep=True))
+
+        inflight = self._structured_inflight.get(cache_key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(
+                self._generate_structured_uncached(prompt, schema, cache_key)
+            )
+            self._structured_inflight[cache_key] = inflight
+            inflight.add_done_callback(
+                lambda _: self._structured_inflight.pop(cache_key, None)
+            )
+            inflight.add_done_callback(self._log_structured_failure)
+        else:
+            logger.debug(
+                "동일한 구조화된 생성 요청 대기",
+                model=self.model,
+                schema=schema.__name__,
+                cache_key=cache_key[:8],
+            )
+
+        # Shield the shared call so one caller's cancellation doesn't fail the rest
+        result = await asyncio.shield(inflight)
+        if isinstance(result, BaseModel):
+            result = result.model_copy(deep=True)
+        return cast(T, result)
+
+    def _log_structured_failure(self, task: asyncio.Task[BaseModel]) -> None:
+        """Retrieve a shared call's error so it is logged even if every waiter left."""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.warning("구조화된 생성 실패", model=self.model, error=str(exc))
+
+    async def _generate_structured_uncached(
+        self, prompt: str, schema: type[T], cache_key: str
+    ) -> T:
+        """Call the model for a structured result and store it in the LRU."""
         logger.debug(
             "구조화된 생성 요청",
             model=self.model,
@@ -151,4 +223,9 @@ class LangchainLLM(LLMProvider):
                 result_type=type(result).__name__,
             )
 
-        return result
+        if isinstance(result, BaseModel):
+            self._structured_cache[cache_key] = result.model_copy(deep=True)
+            if len(self._structured_cache) > self._structured_cache_size:
+                self._structured_cache.popitem(last=False)
+
+        return cast(T, result)
@@ -3,7 +3,7 @@ Dynamic CSS Generation API for Slides
 Generates optimized CSS based on layout/color/persona preferences
 """
 
-from pathlib import Path
+import os
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import Response
@@ -14,16 +14,21 @@ from app.models.enums import LayoutPreference, ColorPreference, PersonaPreferenc
 router = APIRouter(tags=["styles"])
 logger = get_logger(__name__)
 
+# Asset paths resolved once at import (string joins instead of Path objects per request)
+_ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets")
+_CSS_DIR = os.path.join(_ASSETS_DIR, "css")
+_BOOTSTRAP_CSS_PATH = os.path.join(_ASSETS_DIR, "bootstrap-styles.css")
+
 
 def _load_css_file(file_path: str) -> str:
     """Load CSS content from file"""
+    css_path = os.path.join(_CSS_DIR, file_path)
     try:
-        css_path = Path(__file__).parent.parent / "assets" / "css" / file_path
-        if css_path.exists():
-            return css_path.read_text(encoding="utf-8")
-        else:
-            logger.warning(f"CSS file not found: {css_path}")
-            return ""
+        with open(css_path, encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        logger.warning(f"CSS file not found: {css_path}")
+        return ""
     except Exception as e:
         logger.error(f"Error loading CSS file {file_path}: {e}")
         return ""
@@ -32,14 +37,11 @@ def _load_css_file(file_path: str) -> str:
 def _load_base_bootstrap() -> str:
     """Load base Bootstrap CSS"""
     try:
-        css_path = (
-            Path(__file__).parent.parent / "assets" / "bootstrap-styles.css"
-        )
-        if css_path.exists():
-            return css_path.read_text(encoding="utf-8")
-        else:
-            logger.warning("Bootstrap styles not found")
-            return ""
+        with open(_BOOTSTRAP_CSS_PATH, encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        logger.warning("Bootstrap styles not found")
+        return ""
     except Exception as e:
         logger.error(f"Error loading Bootstrap CSS: {e}")
         return ""
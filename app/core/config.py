@@ -23,6 +23,9 @@ class Settings:
     max_decks: int = 3
     max_slide_concurrency: int = 3
 
+    # Advisory slide validation (warnings only); disable to skip the scans
+    validate_slides: bool = True
+
     # CORS
     cors_origins: list[str] = field(
         default_factory=lambda: [
@@ -39,6 +42,12 @@ def _to_int(value: str | None, default: int) -> int:
         return default
 
 
+def _to_bool(value: str | None, default: bool) -> bool:
+    if value is None:
+        return default
+    return value.strip().lower() not in ("0", "false", "no", "off")
+
+
 def load_settings() -> Settings:
     s = Settings()
     s.openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -52,6 +61,9 @@ def load_settings() -> Settings:
     s.max_slide_concurrency = _to_int(
         os.getenv("DECKFLOW_MAX_SLIDE_CONCURRENCY"), s.max_slide_concurrency
     )
+    s.validate_slides = _to_bool(
+        os.getenv("DECKFLOW_VALIDATE_SLIDES"), s.validate_slides
+    )
     # Parse CORS origins: comma-separated list
     cors_env = os.getenv("DECKFLOW_CORS_ORIGINS")
     if cors_env:
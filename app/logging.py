@@ -100,6 +100,22 @@ def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
     return structlog.get_logger(name)
 
 
+def is_debug_enabled(name: str | None = None) -> bool:
+    """
+    Check whether DEBUG events for a logger would actually be emitted.
+
+    Mirrors the stdlib level check applied by ``filter_by_level`` so callers
+    can skip computing debug-only fields when they would be dropped anyway.
+
+    Args:
+        name: Logger name (usually __name__)
+
+    Returns:
+        True if DEBUG level is enabled for the logger
+    """
+    return logging.getLogger(name).isEnabledFor(logging.DEBUG)
+
+
 def bind_context(**kwargs: Any) -> None:
     """
     Bind context to all subsequent log messages in this execution context.
@@ -1,3 +1,6 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from prometheus_fastapi_instrumentator import Instrumentator
@@ -5,13 +8,24 @@ from prometheus_fastapi_instrumentator import Instrumentator
 from app.api import router as api_router
 from app.core.config import settings
 from app.logging import configure_logging
+from app.services.content_creation.css_builder import preload_css_components
+from app.services.content_creation.prompts import preload_layout_prompts
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Warm the CSS component cache so the first slide doesn't pay for disk I/O
+    preload_css_components()
+    # Pre-render the static part of every layout prompt variant
+    preload_layout_prompts()
+    yield
 
 
 def create_app() -> FastAPI:
     # Configure logging based on settings
     configure_logging(level=settings.log_level, compact=True)
 
-    app = FastAPI(title="DeckFlow", version="0.1.0")
+    app = FastAPI(title="DeckFlow", version="0.1.0", lifespan=lifespan)
     app.include_router(api_router)
 
     # CORS: allow configured origins for browser front-ends
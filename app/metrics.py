@@ -30,3 +30,9 @@ llm_requests_total = Counter(
 llm_request_duration_seconds = Histogram(
     "deckflow_llm_request_duration_seconds", "LLM request duration", ["model"]
 )
+
+llm_cache_hits_total = Counter(
+    "deckflow_llm_cache_hits_total",
+    "LLM structured responses served from the in-process cache",
+    ["model", "schema"],
+)
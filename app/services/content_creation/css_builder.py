@@ -7,9 +7,11 @@ This module builds custom CSS by combining:
 3. Layout-specific components based on slide type
 """
 
+import functools
+import os
 from pathlib import Path
 
-from app.logging import get_logger
+from app.logging import get_logger, is_debug_enabled
 from app.models.enums import (
     ColorPreference,
     LayoutPreference,
@@ -99,20 +101,47 @@ PERSONA_STYLES: dict[PersonaPreference, dict[str, str]] = {
 }
 
 
+@functools.lru_cache(maxsize=1)
+def _component_index() -> dict[str, str]:
+    """Scan the components directory once and map file names to paths"""
+    try:
+        with os.scandir(COMPONENTS_DIR) as entries:
+            return {
+                entry.name: entry.path
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(".css")
+            }
+    except OSError as e:
+        logger.error(f"Error scanning CSS components in {COMPONENTS_DIR}: {e}")
+        return {}
+
+
+@functools.lru_cache(maxsize=len(LAYOUT_COMPONENTS))
 def _load_css_component(component_name: str) -> str:
-    """Load CSS component file content"""
-    component_path = COMPONENTS_DIR / component_name
+    """Load CSS component file content (read once per process)"""
+    component_path = _component_index().get(component_name)
+    if component_path is None:
+        logger.warning(f"CSS component not found: {COMPONENTS_DIR / component_name}")
+        return ""
     try:
-        if component_path.exists():
-            return component_path.read_text(encoding="utf-8")
-        else:
-            logger.warning(f"CSS component not found: {component_path}")
-            return ""
+        with open(component_path, encoding="utf-8") as f:
+            return f.read()
     except Exception as e:
         logger.error(f"Error loading CSS component {component_name}: {e}")
         return ""
 
 
+def preload_css_components() -> int:
+    """Read every layout component into the cache ahead of the first request
+
+    Returns:
+        Number of components that were loaded with non-empty content
+    """
+    loaded = sum(1 for name in LAYOUT_COMPONENTS.values() if _load_css_component(name))
+    logger.info("CSS components preloaded", loaded=loaded, total=len(LAYOUT_COMPONENTS))
+    return loaded
+
+
 def _build_color_variables(color_preference: ColorPreference) -> str:
     """Build CSS variables for color scheme"""
     if color_preference not in COLOR_SCHEMES:
@@ -122,11 +151,11 @@ def _build_color_variables(color_preference: ColorPreference) -> str:
         color_preference = ColorPreference.PROFESSIONAL_BLUE
 
     variables = COLOR_SCHEMES[color_preference]
-    css_vars = [f"    {key}: {value};" for key, value in variables.items()]
+    css_vars = "\n".join(f"    {key}: {value};" for key, value in variables.items())
 
     return f"""
 :root {{
-{chr(10).join(css_vars)}
+{css_vars}
 }}
 """
 
@@ -158,6 +187,48 @@ def _build_persona_styles(
 """
 
 
+_BASE_SLIDE_CSS = """
+/* Base Slide Styles */
+body {
+    margin: 0;
+    padding: 0;
+    font-family: system-ui, -apple-system, sans-serif;
+}
+
+.slide-container {
+    width: 100vw;
+    height: 100vh;
+    aspect-ratio: 16/9;
+    max-width: 1200px;
+    margin: 0 auto;
+    background: white;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+    overflow: hidden;
+    position: relative;
+}
+"""
+
+# Preference enums are closed sets, so render their fragments once at import
+_COLOR_VARIABLE_BLOCKS: dict[ColorPreference, str] = {
+    color: _build_color_variables(color) for color in ColorPreference
+}
+_PERSONA_STYLE_BLOCKS: dict[tuple[PersonaPreference, LayoutPreference], str] = {
+    (persona, layout): _build_persona_styles(persona, layout)
+    for persona in PersonaPreference
+    for layout in LayoutPreference
+}
+
+_LAYOUT_PREFERENCE_BLOCKS: dict[LayoutPreference, str] = {
+    layout: f"""
+/* Layout Preference: {layout.value} */
+.slide-container {{
+    /* Add layout-specific modifications here if needed */
+}}
+"""
+    for layout in LayoutPreference
+}
+
+
 def build_slide_css(
     layout_type: LayoutType | str,
     layout_preference: LayoutPreference | str = LayoutPreference.PROFESSIONAL,
@@ -186,63 +257,48 @@ def build_slide_css(
     if isinstance(persona_preference, str):
         persona_preference = validate_persona_preference(persona_preference)
 
-    logger.info(
-        f"Building CSS for layout_type: {layout_type.value}, preferences: {layout_preference.value}/{color_preference.value}/{persona_preference.value}"
+    return _render_slide_css(
+        layout_type, layout_preference, color_preference, persona_preference
     )
 
-    css_parts = []
 
-    # 1. Color variables
-    css_parts.append(_build_color_variables(color_preference))
-
-    # 2. Base slide container styles
-    css_parts.append(
-        """
-/* Base Slide Styles */
-body {
-    margin: 0;
-    padding: 0;
-    font-family: system-ui, -apple-system, sans-serif;
-}
-
-.slide-container {
-    width: 100vw;
-    height: 100vh;
-    aspect-ratio: 16/9;
-    max-width: 1200px;
-    margin: 0 auto;
-    background: white;
-    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-    overflow: hidden;
-    position: relative;
-}
-"""
+# Keyed on validated enums only, so the cache is bounded by the enum product
+@functools.cache
+def _render_slide_css(
+    layout_type: LayoutType,
+    layout_preference: LayoutPreference,
+    color_preference: ColorPreference,
+    persona_preference: PersonaPreference,
+) -> str:
+    """Render the CSS for one preference combination (once per process)"""
+    logger.info(
+        "Building CSS",
+        layout_type=layout_type.value,
+        layout_preference=layout_preference.value,
+        color_preference=color_preference.value,
+        persona_preference=persona_preference.value,
     )
 
-    # 3. Layout-specific component CSS
+    # Layout-specific component CSS (optional: omitted when the file is missing)
+    component_block = ""
     if layout_type in LAYOUT_COMPONENTS:
         component_css = _load_css_component(LAYOUT_COMPONENTS[layout_type])
         if component_css:
-            css_parts.append(
-                f"\n/* {layout_type.title()} Component */\n{component_css}"
+            component_block = (
+                f"\n/* {layout_type.title()} Component */\n{component_css}\n"
             )
 
-    # 4. Persona spacing/typography
-    css_parts.append(_build_persona_styles(persona_preference, layout_preference))
-
-    # 5. Layout preference modifier class
-    css_parts.append(
-        f"""
-/* Layout Preference: {layout_preference.value} */
-.slide-container {{
-    /* Add layout-specific modifications here if needed */
-}}
-"""
+    # Color variables, base styles, component, persona styles, layout modifier
+    complete_css = (
+        f"{_COLOR_VARIABLE_BLOCKS[color_preference]}\n"
+        f"{_BASE_SLIDE_CSS}\n"
+        f"{component_block}"
+        f"{_PERSONA_STYLE_BLOCKS[persona_preference, layout_preference]}\n"
+        f"{_LAYOUT_PREFERENCE_BLOCKS[layout_preference]}"
     )
 
-    complete_css = "\n".join(css_parts)
-
-    logger.debug(f"Generated CSS length: {len(complete_css)} characters")
+    if is_debug_enabled(__name__):
+        logger.debug("Generated CSS", css_length=len(complete_css))
     return complete_css
 
 
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from pydantic import BaseModel
 
 
@@ -6,7 +8,7 @@ class SlideContent(BaseModel):
 
 
 # Color theme mapping for content generation
-COLOR_THEME_MAPPING = {
+_COLOR_THEMES = {
     "professional_blue": {
         "primary": "#1e40af",
         "secondary": "#3b82f6",
@@ -100,7 +102,7 @@ COLOR_THEME_MAPPING = {
 }
 
 # Layout type asset mapping
-LAYOUT_TYPE_ASSET_MAPPING = {
+_LAYOUT_TYPE_ASSETS = {
     "title_slide": "title_slide",
     "content_slide": "content_slide",
     "comparison": "comparison",
@@ -110,3 +112,9 @@ LAYOUT_TYPE_ASSET_MAPPING = {
     "testimonial": "testimonial",
     "call_to_action": "call_to_action",
 }
+
+# Read-only views over the shared lookup tables. The proxies are shallow: the
+# asset mapping holds only strings, but each theme in COLOR_THEME_MAPPING is
+# still a plain dict, so callers must treat those as read-only too
+COLOR_THEME_MAPPING = MappingProxyType(_COLOR_THEMES)
+LAYOUT_TYPE_ASSET_MAPPING = MappingProxyType(_LAYOUT_TYPE_ASSETS)
@@ -5,6 +5,9 @@ This module provides layout-specific prompts that reference
 the dynamically injected CSS components.
 """
 
+import functools
+from string import Formatter
+
 from app.models.enums import (
     LayoutPreference,
     LayoutType,
@@ -163,6 +166,30 @@ GUIDELINES:
 SLIDE DATA: {slide_data}"""
 
 
+def _compile_prompt(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Split a format template once into (literal, field_name) segments
+
+    Format specs and conversions are not carried over, so templates using them
+    are rejected rather than rendered differently from str.format.
+    """
+    segments = []
+    for literal, field_name, spec, conversion in Formatter().parse(template):
+        if spec or conversion:
+            raise ValueError(
+                f"Layout prompt field {field_name!r} uses a format spec or conversion"
+            )
+        segments.append((literal, field_name))
+    return tuple(segments)
+
+
+# Pre-parsed templates so rendering doesn't re-scan the format string per slide
+_COMPILED_LAYOUT_PROMPTS = {
+    layout_type: _compile_prompt(template)
+    for layout_type, template in LAYOUT_PROMPTS.items()
+}
+_COMPILED_DEFAULT_PROMPT = _compile_prompt(DEFAULT_LAYOUT_PROMPT)
+
+
 def get_layout_prompt(
     layout_type: LayoutType | str,
     slide_data: dict,
@@ -181,6 +208,23 @@ def get_layout_prompt(
     Returns:
         Formatted prompt string ready for LLM
     """
+    # Everything except slide_data is resolved once per preference combination
+    chunks = _prepare_layout_prompt(layout_type, layout_preference, persona_preference)
+    return str(slide_data).join(chunks)
+
+
+# Sized to hold every LayoutType x LayoutPreference x PersonaPreference variant
+@functools.lru_cache(maxsize=128)
+def _prepare_layout_prompt(
+    layout_type: LayoutType | str,
+    layout_preference: LayoutPreference | str,
+    persona_preference: PersonaPreference | str,
+) -> tuple[str, ...]:
+    """Partially render a layout prompt, leaving only the slide_data slots
+
+    Returns:
+        Literal chunks to be joined with the rendered slide data
+    """
     # Validate and convert to enums
     if isinstance(layout_type, str):
         layout_type = validate_layout_type(layout_type)
@@ -189,15 +233,37 @@ def get_layout_prompt(
     if isinstance(persona_preference, str):
         persona_preference = validate_persona_preference(persona_preference)
 
-    # Get the appropriate prompt template
-    prompt_template = LAYOUT_PROMPTS.get(layout_type, DEFAULT_LAYOUT_PROMPT)
+    # Get the appropriate pre-parsed prompt template
+    segments = _COMPILED_LAYOUT_PROMPTS.get(layout_type, _COMPILED_DEFAULT_PROMPT)
+
+    # Fill the preference placeholders; split at each slide_data slot
+    values = {
+        "layout_preference": layout_preference.value,
+        "persona_preference": persona_preference.value,
+    }
+    chunks = [""]
+    for literal, field_name in segments:
+        chunks[-1] += literal
+        if field_name == "slide_data":
+            chunks.append("")
+        elif field_name is not None:
+            chunks[-1] += values[field_name]
+    return tuple(chunks)
 
-    # Format with provided data
-    return prompt_template.format(
-        slide_data=slide_data,
-        layout_preference=layout_preference.value,
-        persona_preference=persona_preference.value,
-    )
+
+def preload_layout_prompts() -> int:
+    """Partially render every layout/preference combination ahead of use
+
+    Returns:
+        Number of prepared prompt variants
+    """
+    for layout_type in LayoutType:
+        for layout_preference in LayoutPreference:
+            for persona_preference in PersonaPreference:
+                _prepare_layout_prompt(
+                    layout_type, layout_preference, persona_preference
+                )
+    return _prepare_layout_prompt.cache_info().currsize
 
 
 def get_available_layouts() -> list[LayoutType]:
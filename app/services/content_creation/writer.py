@@ -1,30 +1,18 @@
-from pathlib import Path
+import asyncio
+import functools
+import hashlib
+import re
 
-from app.logging import get_logger
+from app.core.config import settings
+from app.logging import get_logger, is_debug_enabled
 
+from .css_builder import build_slide_css
 from .models import SlideContent
+from .prompts import get_layout_prompt
 
 logger = get_logger(__name__)
 
 
-def _load_bootstrap_css() -> str:
-    """Load Bootstrap-based styles"""
-    try:
-        css_path = (
-            Path(__file__).parent.parent.parent
-            / "assets"
-            / "bootstrap-styles.css"
-        )
-        if css_path.exists():
-            return css_path.read_text(encoding="utf-8")
-        else:
-            logger.warning(f"Bootstrap styles not found: {css_path}")
-            return ""
-    except Exception as e:
-        logger.error(f"Error loading Bootstrap CSS file: {e}")
-        return ""
-
-
 def _get_persona_prefix(persona: str) -> str:
     """Get CSS prefix for persona"""
     persona_mapping = {
@@ -35,6 +23,29 @@ def _get_persona_prefix(persona: str) -> str:
     return persona_mapping.get(persona, "balanced")
 
 
+# Static parts of the slide <head>; only the generated CSS varies per slide
+_HEAD_PREFIX = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>DeckFlow Slide</title>
+
+    <!-- Bootstrap CSS -->
+    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
+
+    <!-- TinyMCE Editor -->
+    <script src="https://cdn.jsdelivr.net/npm/tinymce@6.8.3/tinymce.min.js"></script>
+
+    <!-- Dynamic Layout-Specific CSS -->
+    <style>
+"""
+_HEAD_SUFFIX = """
+    </style>
+</head>"""
+
+
+@functools.lru_cache(maxsize=64)
 def _build_html_head(
     layout_type: str,
     layout_preference: str,
@@ -42,8 +53,6 @@ def _build_html_head(
     persona_preference: str,
 ) -> str:
     """Build HTML head section with dynamic CSS injection"""
-    from .css_builder import build_slide_css
-
     # Generate layout-specific CSS
     custom_css = build_slide_css(
         layout_type=layout_type,
@@ -52,26 +61,23 @@ def _build_html_head(
         persona_preference=persona_preference,
     )
 
-    head_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>DeckFlow Slide</title>
+    return f"{_HEAD_PREFIX}{custom_css}{_HEAD_SUFFIX}"
 
-    <!-- Bootstrap CSS -->
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
 
-    <!-- TinyMCE Editor -->
-    <script src="https://cdn.jsdelivr.net/npm/tinymce@6.8.3/tinymce.min.js"></script>
+# Leading <body ...> wrapper the LLM sometimes keeps around the slide markup
+_BODY_OPEN_TAG_RE = re.compile(r"\s*<body[^>]*>")
 
-    <!-- Dynamic Layout-Specific CSS -->
-    <style>
-{custom_css}
-    </style>
-</head>"""
+# Fixed pieces of the assembled document around the per-slide body classes
+_BODY_BASE_CLASSES = (
+    "d-flex align-items-center justify-content-center min-vh-100 bg-light "
+    "overflow-hidden"
+)
+_BODY_OPEN = '\n<body class="'
+_BODY_CLOSE = "\n</body>\n</html>"
+_TINYMCE_SCRIPT = """
 
-    return head_content
+<!-- TinyMCE Editor Script -->
+<script src="/static/js/tinymce-editor.js"></script>"""
 
 
 def _combine_html_parts(
@@ -79,45 +85,38 @@ def _combine_html_parts(
     body_content: str,
     layout_preference: str = "professional",
     color_preference: str = "professional_blue",
-    persona_preference: str = "balanced"
+    persona_preference: str = "balanced",
+    include_editor_script: bool = False,
 ) -> str:
     """Combine head and body content into complete HTML with CSS classes"""
     # Extract body content (remove <body> and </body> tags if present)
-    if body_content.strip().startswith("<body"):
-        body_start = body_content.find(">") + 1
-        body_end = body_content.rfind("</body>")
-        if body_end == -1:
-            body_end = len(body_content)
-        body_inner = body_content[body_start:body_end].strip()
+    body_open = _BODY_OPEN_TAG_RE.match(body_content)
+    if body_open:
+        body_end = body_content.rfind("</body>", body_open.end())
+        body_inner = body_content[
+            body_open.end() : body_end if body_end != -1 else None
+        ].strip()
     else:
         body_inner = body_content.strip()
 
     # Build CSS classes for body tag
-    css_classes = [
-        "d-flex", "align-items-center", "justify-content-center",
-        "min-vh-100", "bg-light", "overflow-hidden",
-        f"layout-{layout_preference}",
-        f"theme-{color_preference}",
-        f"persona-{persona_preference}"
-    ]
-
-    return f"""{head_content}
-<body class="{' '.join(css_classes)}">
-    {body_inner}
-</body>
-</html>"""
-
-
-def _inject_tinymce_script(html: str) -> str:
-    """Inject external TinyMCE editor script"""
-    tinymce_script = """
-<!-- TinyMCE Editor Script -->
-<script src="/static/js/tinymce-editor.js"></script>"""
+    body_classes = (
+        f"{_BODY_BASE_CLASSES} layout-{layout_preference} "
+        f"theme-{color_preference} persona-{persona_preference}"
+    )
 
-    if "</body>" in html:
-        return html.replace("</body>", f"{tinymce_script}\n</body>")
-    else:
-        return html + tinymce_script
+    # Single join; the TinyMCE script goes right before </body> when editing
+    return "".join(
+        (
+            head_content,
+            _BODY_OPEN,
+            body_classes,
+            '">\n    ',
+            body_inner,
+            _TINYMCE_SCRIPT if include_editor_script else "",
+            _BODY_CLOSE,
+        )
+    )
 
 
 # The massive prompt has been replaced with modular layout-specific prompts
@@ -131,8 +130,10 @@ def _extract_body_content(html_content: str, slide_title: str) -> str:
 
     content = html_content.strip()
 
+    content_lower = content.lower()
+
     # If LLM generated complete HTML, extract just the body inner content
-    if "<!doctype" in content.lower() or "<html" in content.lower():
+    if "<!doctype" in content_lower or "<html" in content_lower:
         logger.info(
             "Complete HTML detected, extracting body content", slide_title=slide_title
         )
@@ -141,8 +142,8 @@ def _extract_body_content(html_content: str, slide_title: str) -> str:
         body_start_tag = "<body"
         body_end_tag = "</body>"
 
-        body_start_index = content.lower().find(body_start_tag)
-        body_end_index = content.lower().find(body_end_tag)
+        body_start_index = content_lower.find(body_start_tag)
+        body_end_index = content_lower.find(body_end_tag)
 
         if body_start_index != -1 and body_end_index != -1:
             # Find the end of the opening body tag
@@ -177,6 +178,25 @@ def _extract_body_content(html_content: str, slide_title: str) -> str:
     return content
 
 
+# Document-level tags the LLM must not emit inside the slide body; each match
+# is removed up to the closing ">" of the tag it starts (group 1 is the element)
+_FORBIDDEN_ELEMENTS = (
+    "<!doctype",
+    "<html",
+    "<head",
+    "</head>",
+    "</html>",
+    "<meta",
+    "<title",
+    '<script src="https://cdn.tailwindcss.com"',
+    "tailwind",
+)
+_FORBIDDEN_ELEMENT_RE = re.compile(
+    "(" + "|".join(map(re.escape, _FORBIDDEN_ELEMENTS)) + ")[^>]*>",
+    re.IGNORECASE,
+)
+
+
 def _validate_body_content(body_content: str, slide_title: str) -> str:
     """Validate and sanitize body content to ensure it's only body HTML"""
     if not body_content or not body_content.strip():
@@ -185,34 +205,112 @@ def _validate_body_content(body_content: str, slide_title: str) -> str:
     # First extract the actual body content
     inner_content = _extract_body_content(body_content, slide_title)
 
-    # Remove any remaining forbidden elements
-    forbidden_elements = [
-        "<!doctype",
-        "<html",
-        "<head",
-        "</head>",
-        "</html>",
-        "<meta",
-        "<title",
-        '<script src="https://cdn.tailwindcss.com"',
-        "tailwind",
-    ]
+    # Remove any remaining forbidden elements (one pass for all of them),
+    # noting which ones the LLM emitted
+    removed_elements: set[str] = set()
 
-    cleaned_content = inner_content
-    for forbidden in forbidden_elements:
-        if forbidden in cleaned_content.lower():
-            logger.warning(
-                f"Removing forbidden element: {forbidden}", slide_title=slide_title
-            )
-            # More aggressive removal
-            import re
+    def _drop(match: re.Match[str]) -> str:
+        removed_elements.add(match.group(1).lower())
+        return ""
 
-            pattern = re.escape(forbidden) + r"[^>]*>"
-            cleaned_content = re.sub(pattern, "", cleaned_content, flags=re.IGNORECASE)
+    cleaned_content, removed_count = _FORBIDDEN_ELEMENT_RE.subn(_drop, inner_content)
+    if removed_count:
+        logger.warning(
+            "Removed forbidden elements",
+            elements=sorted(removed_elements),
+            removed_count=removed_count,
+            slide_title=slide_title,
+        )
 
     return cleaned_content.strip()
 
 
+# List items: <li> tags, bullet glyphs, or "- " bullets at the start of a line
+# (a bare "-" would also match every hyphenated class name)
+_LIST_ITEM_RE = re.compile(r"<li[\s>]|•|^[ \t]*-\s", re.MULTILINE)
+
+# Class-name tokens checked (case-sensitively) by _validate_slide_content
+_ASPECT_RATIO_TOKENS = ("aspect-ratio: 16/9", "aspect-ratio:16/9")
+_RESPONSIVE_HEIGHT_TOKENS = ("h-screen", "max-h-screen", "h-full")
+_LARGE_TEXT_TOKENS = ("text-3xl", "text-4xl", "text-5xl", "text-6xl")
+_FIXED_HEIGHT_TOKENS = (
+    "h-96",
+    "h-80",
+    "h-72",
+    "h-64",
+    "h-60",
+    "h-56",
+    "h-52",
+    "h-48",
+    "h-44",
+    "h-40",
+    "h-36",
+    "h-32",
+    "h-28",
+    "h-24",
+    "h-20",
+    "h-16",
+)
+_LARGE_PADDING_TOKENS = (
+    "p-12",
+    "p-16",
+    "p-20",
+    "py-12",
+    "py-16",
+    "py-20",
+    "pt-12",
+    "pt-16",
+    "pt-20",
+    "pb-12",
+    "pb-16",
+    "pb-20",
+)
+_LARGE_MARGIN_TOKENS = (
+    "m-12",
+    "m-16",
+    "m-20",
+    "my-12",
+    "my-16",
+    "my-20",
+    "mt-12",
+    "mt-16",
+    "mt-20",
+    "mb-12",
+    "mb-16",
+    "mb-20",
+)
+_LARGE_GAP_TOKENS = (
+    "gap-12",
+    "gap-16",
+    "gap-20",
+    "space-y-12",
+    "space-y-16",
+    "space-y-20",
+)
+# Case-insensitive markers, ordered most-likely-first so any() exits early
+# (the bundled component CSS uses transform:/transition: but no keyframes)
+_ANIMATION_MARKERS = ("transform:", "transition:", "animation:", "@keyframes")
+_EVENT_HANDLER_MARKERS = (
+    "onload=",
+    "onchange=",
+    "addeventlistener",
+    "onmouseover=",
+    "onmouseout=",
+)
+_CLASS_TOKENS = frozenset(
+    (
+        "overflow-hidden",
+        *_ASPECT_RATIO_TOKENS,
+        *_RESPONSIVE_HEIGHT_TOKENS,
+        *_LARGE_TEXT_TOKENS,
+        *_FIXED_HEIGHT_TOKENS,
+        *_LARGE_PADDING_TOKENS,
+        *_LARGE_MARGIN_TOKENS,
+        *_LARGE_GAP_TOKENS,
+    )
+)
+
+
 def _validate_slide_content(content: SlideContent, slide_title: str) -> list[str]:
     """슬라이드 콘텐츠의 기본 품질을 검증하고 경고 목록을 반환합니다."""
     warnings = []
@@ -222,10 +320,13 @@ def _validate_slide_content(content: SlideContent, slide_title: str) -> list[str
         logger.error("생성된 HTML 콘텐츠가 비어 있습니다.", slide_title=slide_title)
         raise ValueError("Generated HTML content is empty.")
 
-    if "bootstrap" not in html.lower():
+    # Lower-case once; every case-insensitive check below reuses this copy
+    html_lower = html.lower()
+
+    if "bootstrap" not in html_lower:
         warnings.append("Bootstrap CSS가 누락되었습니다.")
 
-    if "</html>" not in html.lower():
+    if "</html>" not in html_lower:
         warnings.append("완전한 HTML 문서가 아닙니다. `</html>` 태그가 없습니다.")
 
     if len(html) < 200:
@@ -233,8 +334,8 @@ def _validate_slide_content(content: SlideContent, slide_title: str) -> list[str
 
     # Check for content that might cause overflow
     content_body = (
-        html[html.lower().find("<body") : html.lower().rfind("</body>") + 7]
-        if "<body" in html.lower()
+        html[html_lower.find("<body") : html_lower.rfind("</body>") + 7]
+        if "<body" in html_lower
         else html
     )
 
@@ -242,9 +343,7 @@ def _validate_slide_content(content: SlideContent, slide_title: str) -> list[str
     overflow_indicators = []
 
     # Count bullet points/list items
-    list_items = (
-        content_body.count("<li") + content_body.count("•") + content_body.count("-")
-    )
+    list_items = len(_LIST_ITEM_RE.findall(content_body))
     if list_items > 6:
         overflow_indicators.append(f"too many list items ({list_items})")
 
@@ -262,29 +361,20 @@ def _validate_slide_content(content: SlideContent, slide_title: str) -> list[str
         warnings.append(f"콘텐츠가 화면을 초과할 수 있습니다: {overflow_indicators}")
 
     # Check for key requirements from simplified prompt
+    # (one containment test per known class token, then set lookups)
+    found_tokens = {token for token in _CLASS_TOKENS if token in html}
+
     requirement_checks = [
-        (
-            "16:9 aspect ratio",
-            "aspect-ratio: 16/9" in html or "aspect-ratio:16/9" in html,
-        ),
-        ("overflow prevention", "overflow-hidden" in html),
+        ("16:9 aspect ratio", not found_tokens.isdisjoint(_ASPECT_RATIO_TOKENS)),
+        ("overflow prevention", "overflow-hidden" in found_tokens),
         (
             "responsive height",
-            any(h in html for h in ["h-screen", "max-h-screen", "h-full"]),
-        ),
-        (
-            "text size limits",
-            not any(
-                large in html
-                for large in ["text-3xl", "text-4xl", "text-5xl", "text-6xl"]
-            ),
+            not found_tokens.isdisjoint(_RESPONSIVE_HEIGHT_TOKENS),
         ),
+        ("text size limits", found_tokens.isdisjoint(_LARGE_TEXT_TOKENS)),
         (
             "no animations",
-            not any(
-                anim in html.lower()
-                for anim in ["@keyframes", "animation:", "transition:", "transform:"]
-            ),
+            not any(anim in html_lower for anim in _ANIMATION_MARKERS),
         ),
         (
             "no custom scripts",
@@ -294,103 +384,20 @@ def _validate_slide_content(content: SlideContent, slide_title: str) -> list[str
 
     # Additional strict checks for vertical overflow prevention
     overflow_prevention_checks = [
-        (
-            "no fixed heights",
-            not any(
-                h in html
-                for h in [
-                    "h-96",
-                    "h-80",
-                    "h-72",
-                    "h-64",
-                    "h-60",
-                    "h-56",
-                    "h-52",
-                    "h-48",
-                    "h-44",
-                    "h-40",
-                    "h-36",
-                    "h-32",
-                    "h-28",
-                    "h-24",
-                    "h-20",
-                    "h-16",
-                ]
-            ),
-        ),
-        (
-            "no large padding",
-            not any(
-                p in html
-                for p in [
-                    "p-12",
-                    "p-16",
-                    "p-20",
-                    "py-12",
-                    "py-16",
-                    "py-20",
-                    "pt-12",
-                    "pt-16",
-                    "pt-20",
-                    "pb-12",
-                    "pb-16",
-                    "pb-20",
-                ]
-            ),
-        ),
-        (
-            "no large margins",
-            not any(
-                m in html
-                for m in [
-                    "m-12",
-                    "m-16",
-                    "m-20",
-                    "my-12",
-                    "my-16",
-                    "my-20",
-                    "mt-12",
-                    "mt-16",
-                    "mt-20",
-                    "mb-12",
-                    "mb-16",
-                    "mb-20",
-                ]
-            ),
-        ),
-        (
-            "no large gaps",
-            not any(
-                g in html
-                for g in [
-                    "gap-12",
-                    "gap-16",
-                    "gap-20",
-                    "space-y-12",
-                    "space-y-16",
-                    "space-y-20",
-                ]
-            ),
-        ),
+        ("no fixed heights", found_tokens.isdisjoint(_FIXED_HEIGHT_TOKENS)),
+        ("no large padding", found_tokens.isdisjoint(_LARGE_PADDING_TOKENS)),
+        ("no large margins", found_tokens.isdisjoint(_LARGE_MARGIN_TOKENS)),
+        ("no large gaps", found_tokens.isdisjoint(_LARGE_GAP_TOKENS)),
     ]
 
     # Check for custom JavaScript content (beyond just script tags)
     script_content_checks = [
-        ("no onclick handlers", "onclick=" not in html.lower()),
+        ("no onclick handlers", "onclick=" not in html_lower),
         (
             "no event listeners",
-            not any(
-                event in html.lower()
-                for event in [
-                    "addeventlistener",
-                    "onload=",
-                    "onmouseover=",
-                    "onmouseout=",
-                    "onchange=",
-                ]
-            ),
+            not any(event in html_lower for event in _EVENT_HANDLER_MARKERS),
         ),
-        ("no javascript urls", "javascript:" not in html.lower()),
+        ("no javascript urls", "javascript:" not in html_lower),
     ]
 
     # Combine all checks
@@ -406,6 +413,49 @@ def _validate_slide_content(content: SlideContent, slide_title: str) -> list[str
     return warnings
 
 
+# Strong references to in-flight advisory validations (asyncio only keeps weak ones)
+_background_validations: set[asyncio.Task] = set()
+
+
+def _on_validation_done(task: asyncio.Task) -> None:
+    """Release a finished validation task and surface unexpected failures"""
+    _background_validations.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("슬라이드 검증 실패", error=str(task.exception()))
+
+
+def _schedule_validation(content: SlideContent, slide_title: str) -> None:
+    """Run the advisory slide validation off the request path"""
+    task = asyncio.create_task(
+        asyncio.to_thread(_validate_slide_content, content, slide_title)
+    )
+    _background_validations.add(task)
+    task.add_done_callback(_on_validation_done)
+
+
+# Static prompt sections appended after the layout prompt in write_content
+_MODIFICATION_SECTION_HEAD = """
+
+MODIFICATION REQUEST:
+
+## MODIFICATION REQUEST
+The user wants to modify this existing slide with the following request:
+\""""
+_MODIFICATION_SECTION_TAIL = """\"
+
+Please incorporate these changes while maintaining the overall structure and design consistency with the deck theme.
+Focus on addressing the specific modification request while keeping the professional appearance.
+"""
+_EDITOR_NOTES_SECTION = """
+
+EDITOR NOTES:
+
+## EDITOR MODE ENABLED
+This slide will have TinyMCE inline editor injected after generation.
+Editor scripts will be automatically added - focus on creating clean, semantic HTML structure.
+"""
+
+
 async def write_content(
     slide_info: dict,
     deck_context: dict,
@@ -434,51 +484,42 @@ async def write_content(
         persona_preference = deck_context.get("persona_preference", "balanced")
         _get_persona_prefix(persona_preference)
 
-        # 수정 컨텍스트 준비
-        modification_context = ""
-        if is_modification and modification_prompt:
-            modification_context = f"""
-## MODIFICATION REQUEST
-The user wants to modify this existing slide with the following request:
-"{modification_prompt}"
-
-Please incorporate these changes while maintaining the overall structure and design consistency with the deck theme.
-Focus on addressing the specific modification request while keeping the professional appearance.
-"""
-
-        # 편집 컨텍스트 준비
-        editing_context = ""
-        if enable_editing:
-            editing_context = """
-## EDITOR MODE ENABLED
-This slide will have TinyMCE inline editor injected after generation.
-Editor scripts will be automatically added - focus on creating clean, semantic HTML structure.
-"""
-
-        # Use the new modular prompt system
-        from .prompts import get_layout_prompt
-
         layout_type = slide_info.get("layout_type", "content_slide")
 
-        # Get layout-specific prompt
-        formatted_prompt = get_layout_prompt(
-            layout_type=layout_type,
-            slide_data=slide_info,
-            layout_preference=layout_preference,
-            persona_preference=persona_preference,
-        )
-
-        # Add modification context if needed
-        if modification_context:
-            formatted_prompt += f"\n\nMODIFICATION REQUEST:\n{modification_context}"
+        # Get layout-specific prompt, then append the static context sections
+        prompt_parts = [
+            get_layout_prompt(
+                layout_type=layout_type,
+                slide_data=slide_info,
+                layout_preference=layout_preference,
+                persona_preference=persona_preference,
+            )
+        ]
 
-        # Add editing context if needed
-        if editing_context:
-            formatted_prompt += f"\n\nEDITOR NOTES:\n{editing_context}"
+        # 수정 컨텍스트 추가
+        if is_modification and modification_prompt:
+            prompt_parts += (
+                _MODIFICATION_SECTION_HEAD,
+                modification_prompt,
+                _MODIFICATION_SECTION_TAIL,
+            )
 
-        logger.debug(
-            f"{mode_text} 프롬프트 준비 완료", prompt_length=len(formatted_prompt)
-        )
+        # 편집 컨텍스트 추가
+        if enable_editing:
+            prompt_parts.append(_EDITOR_NOTES_SECTION)
+
+        formatted_prompt = "".join(prompt_parts)
+
+        if is_debug_enabled(__name__):
+            # Short fingerprint to correlate identical prompts across slides
+            prompt_hash = hashlib.blake2b(
+                formatted_prompt.encode("utf-8", "ignore"), digest_size=4
+            ).hexdigest()
+            logger.debug(
+                f"{mode_text} 프롬프트 준비 완료",
+                prompt_length=len(formatted_prompt),
+                prompt_hash=prompt_hash,
+            )
 
         logger.info(
             "🤖 [WRITE_CONTENT] LLM 호출 시작 (Body-only generation)",
@@ -510,20 +551,18 @@ Editor scripts will be automatically added - focus on creating clean, semantic H
             body_content,
             layout_preference=layout_preference,
             color_preference=color_preference,
-            persona_preference=persona_preference
+            persona_preference=persona_preference,
+            include_editor_script=enable_editing,
         )
-
-        # Create final content object
-        content = SlideContent(html_content=complete_html)
-
-        # Inject TinyMCE script if editing is enabled
         if enable_editing:
-            content.html_content = _inject_tinymce_script(content.html_content)
             logger.info("TinyMCE 편집 스크립트 주입 완료", slide_title=slide_title)
 
-        warnings = _validate_slide_content(content, slide_title)
-        if warnings:
-            logger.warning("Slide content validation warnings", warnings=warnings)
+        # Create final content object (HTML was assembled here, skip re-validation)
+        content = SlideContent.model_construct(html_content=complete_html)
+
+        # Validation only emits warnings, so it must not hold up the slide
+        if settings.validate_slides:
+            _schedule_validation(content, slide_title)
 
         logger.info(
             f"슬라이드 {mode_text.lower()} 완료",
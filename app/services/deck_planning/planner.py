@@ -1,7 +1,18 @@
-from app.logging import get_logger
+from bisect import bisect_right
+from dataclasses import dataclass, field
+
+from app.logging import get_logger, is_debug_enabled
+
+# app.models.config imports .prompts, so bind the submodule rather than the class:
+# this resolves even while either side of the cycle is still initializing
+from app.models.config import deck_generation
 
 from .models import DeckPlan
-from .prompts import AVAILABLE_PROMPTS
+from .prompts import (
+    AVAILABLE_PROMPTS,
+    generate_basic_prompt,
+    generate_persona_prompt,
+)
 
 logger = get_logger(__name__)
 
@@ -11,12 +22,9 @@ async def plan_deck(prompt: str, llm, config=None) -> DeckPlan:
     if not prompt.strip():
         raise ValueError("발표 요청은 필수입니다")
 
-    # Import here to avoid circular imports
-    from app.models.config import DeckGenerationConfig
-
     # Use provided config or create default
     if config is None:
-        config = DeckGenerationConfig()
+        config = deck_generation.DeckGenerationConfig()
 
     persona = config.persona
 
@@ -33,16 +41,13 @@ async def plan_deck(prompt: str, llm, config=None) -> DeckPlan:
     )
 
     # Generate prompt using the new template system with full config
-    from .prompts import generate_persona_prompt
-
     try:
         enhanced_prompt = generate_persona_prompt(persona, config, prompt)
         logger.debug("Generated prompt", length=len(enhanced_prompt))
     except Exception as e:
         logger.error("Failed to generate prompt", error=str(e), persona=persona)
         # Fallback to old method
-        planning_prompt = AVAILABLE_PROMPTS[persona]
-        enhanced_prompt = planning_prompt.format(prompt=prompt)
+        enhanced_prompt = generate_basic_prompt(persona, prompt, config)
 
     logger.info("프롬프트 준비 완료", prompt_length=len(enhanced_prompt))
 
@@ -60,17 +65,18 @@ async def plan_deck(prompt: str, llm, config=None) -> DeckPlan:
             step="plan_generation_complete",
         )
 
-        for slide in plan.slides:
-            logger.debug(
-                f"슬라이드 {slide.slide_id}: {slide.slide_title}",
-                message=slide.message,
-                key_points_count=len(slide.key_points),
-                data_points_count=len(slide.data_points),
-                expert_insights_count=len(slide.expert_insights),
-                supporting_facts_count=len(slide.supporting_facts),
-                quantitative_details_count=len(slide.quantitative_details),
-                layout_type=slide.layout_type.value,
-            )
+        if is_debug_enabled(__name__):
+            for slide in plan.slides:
+                logger.debug(
+                    f"슬라이드 {slide.slide_id}: {slide.slide_title}",
+                    message=slide.message,
+                    key_points_count=len(slide.key_points),
+                    data_points_count=len(slide.data_points),
+                    expert_insights_count=len(slide.expert_insights),
+                    supporting_facts_count=len(slide.supporting_facts),
+                    quantitative_details_count=len(slide.quantitative_details),
+                    layout_type=slide.layout_type.value,
+                )
 
         return plan
 
@@ -79,7 +85,71 @@ async def plan_deck(prompt: str, llm, config=None) -> DeckPlan:
         raise RuntimeError(f"덱 플랜 생성에 실패했습니다: {e}") from e
 
 
-def _calculate_plan_score(plan: DeckPlan) -> dict:
+@dataclass(slots=True)
+class _PlanStats:
+    """덱 플랜을 한 번 순회해 모은 검증/채점용 집계값"""
+
+    slide_count: int = 0
+    ids_sequential: bool = True
+    duplicate_ids: list[int] = field(default_factory=list)
+    total_points: int = 0
+    total_data_points: int = 0
+    total_insights: int = 0
+    total_facts: int = 0
+    total_quant: int = 0
+    n_with_points: int = 0
+    n_with_insights: int = 0
+    n_with_data: int = 0
+    n_with_facts: int = 0
+    n_with_quant: int = 0
+    n_fully_loaded: int = 0
+    n_optimal_titles: int = 0
+    n_good_messages: int = 0
+
+
+def _analyze_plan(plan: DeckPlan) -> _PlanStats:
+    """슬라이드를 한 번만 순회하며 모든 카운터를 집계"""
+    slides = plan.slides
+    stats = _PlanStats(slide_count=len(slides))
+    seen_ids = set()
+    for position, s in enumerate(slides, 1):
+        slide_id = s.slide_id
+        if slide_id != position:
+            stats.ids_sequential = False
+        if slide_id in seen_ids:
+            stats.duplicate_ids.append(slide_id)
+        seen_ids.add(slide_id)
+
+        n_points = len(s.key_points)
+        n_data = len(s.data_points)
+        n_insights = len(s.expert_insights)
+        n_facts = len(s.supporting_facts)
+        n_quant = len(s.quantitative_details)
+        stats.total_points += n_points
+        stats.total_data_points += n_data
+        stats.total_insights += n_insights
+        stats.total_facts += n_facts
+        stats.total_quant += n_quant
+        if n_points:
+            stats.n_with_points += 1
+        if n_insights:
+            stats.n_with_insights += 1
+        if n_data:
+            stats.n_with_data += 1
+        if n_facts:
+            stats.n_with_facts += 1
+        if n_quant:
+            stats.n_with_quant += 1
+        if n_data and n_insights and n_facts and n_quant:
+            stats.n_fully_loaded += 1
+        if 10 <= len(s.slide_title) <= 60:
+            stats.n_optimal_titles += 1
+        if len(s.message) >= 15:
+            stats.n_good_messages += 1
+    return stats
+
+
+def _calculate_plan_score(plan: DeckPlan, stats: _PlanStats | None = None) -> dict:
     """데이터 풍부한 덱 플랜의 품질을 정량적으로 평가"""
     score_details = {
         "total": 0,
@@ -89,7 +159,9 @@ def _calculate_plan_score(plan: DeckPlan) -> dict:
         "clarity": 0,  # 명확성 (0-15점)
     }
 
-    slide_count = len(plan.slides)
+    if stats is None:
+        stats = _analyze_plan(plan)
+    slide_count = stats.slide_count
 
     # 구조적 완성도 (25점 만점)
     if 5 <= slide_count <= 8:  # 최적 슬라이드 수
@@ -100,8 +172,7 @@ def _calculate_plan_score(plan: DeckPlan) -> dict:
         score_details["structure"] += 4
 
     # 슬라이드 번호 연속성 (5점)
-    ids = [s.slide_id for s in plan.slides]
-    if ids == list(range(1, len(ids) + 1)):
+    if stats.ids_sequential:
         score_details["structure"] += 5
 
     # 핵심 필드 완성도 (8점)
@@ -111,13 +182,11 @@ def _calculate_plan_score(plan: DeckPlan) -> dict:
         score_details["structure"] += 4
 
     # 내용 충실도 (35점 만점)
-    slides_with_points = [s for s in plan.slides if s.key_points]
-    content_ratio = len(slides_with_points) / slide_count if slide_count > 0 else 0
+    content_ratio = stats.n_with_points / slide_count if slide_count > 0 else 0
     score_details["content"] += int(content_ratio * 15)  # 최대 15점
 
     # 평균 키 포인트 개수 (3-5개가 최적)
-    total_points = sum(len(s.key_points) for s in plan.slides)
-    avg_points = total_points / slide_count if slide_count > 0 else 0
+    avg_points = stats.total_points / slide_count if slide_count > 0 else 0
     if 3 <= avg_points <= 5:
         score_details["content"] += 12
     elif 2 <= avg_points <= 6:
@@ -126,49 +195,33 @@ def _calculate_plan_score(plan: DeckPlan) -> dict:
         score_details["content"] += 4
 
     # 전문가 인사이트 활용도 (8점)
-    slides_with_insights = [s for s in plan.slides if s.expert_insights]
-    insight_ratio = len(slides_with_insights) / slide_count if slide_count > 0 else 0
+    insight_ratio = stats.n_with_insights / slide_count if slide_count > 0 else 0
     score_details["content"] += int(insight_ratio * 8)
 
     # 데이터 풍부도 (25점 만점) - 새로운 평가 기준
     # 기본 데이터 포인트 (8점)
-    slides_with_data = [s for s in plan.slides if s.data_points]
-    data_ratio = len(slides_with_data) / slide_count if slide_count > 0 else 0
+    data_ratio = stats.n_with_data / slide_count if slide_count > 0 else 0
     score_details["data_richness"] += int(data_ratio * 8)
 
     # 지원 팩트 (6점)
-    slides_with_facts = [s for s in plan.slides if s.supporting_facts]
-    facts_ratio = len(slides_with_facts) / slide_count if slide_count > 0 else 0
+    facts_ratio = stats.n_with_facts / slide_count if slide_count > 0 else 0
     score_details["data_richness"] += int(facts_ratio * 6)
 
     # 정량적 세부사항 (8점)
-    slides_with_quant = [s for s in plan.slides if s.quantitative_details]
-    quant_ratio = len(slides_with_quant) / slide_count if slide_count > 0 else 0
+    quant_ratio = stats.n_with_quant / slide_count if slide_count > 0 else 0
     score_details["data_richness"] += int(quant_ratio * 8)
 
     # 데이터 밀도 보너스 (3점) - 모든 필드가 채워진 슬라이드 비율
-    fully_loaded_slides = [
-        s
-        for s in plan.slides
-        if s.data_points
-        and s.expert_insights
-        and s.supporting_facts
-        and s.quantitative_details
-    ]
-    if len(fully_loaded_slides) > slide_count * 0.5:  # 50% 이상이 풀로 채워짐
+    if stats.n_fully_loaded > slide_count * 0.5:  # 50% 이상이 풀로 채워짐
         score_details["data_richness"] += 3
 
     # 명확성 (15점 만점)
     # 제목 길이 적정성 (6점)
-    title_lengths = [len(s.slide_title) for s in plan.slides]
-    optimal_titles = [t for t in title_lengths if 10 <= t <= 60]
-    title_ratio = len(optimal_titles) / slide_count if slide_count > 0 else 0
+    title_ratio = stats.n_optimal_titles / slide_count if slide_count > 0 else 0
     score_details["clarity"] += int(title_ratio * 6)
 
     # 메시지 충실도 (5점)
-    message_lengths = [len(s.message) for s in plan.slides]
-    good_messages = [m for m in message_lengths if m >= 15]
-    message_ratio = len(good_messages) / slide_count if slide_count > 0 else 0
+    message_ratio = stats.n_good_messages / slide_count if slide_count > 0 else 0
     score_details["clarity"] += int(message_ratio * 5)
 
     # 청중 명시성 (4점)
@@ -186,77 +239,64 @@ def _calculate_plan_score(plan: DeckPlan) -> dict:
     return score_details
 
 
+# 등급 하한 점수와 등급명 (_GRADE_LABELS[i]는 _GRADE_CUTOFFS[i - 1] 이상)
+_GRADE_CUTOFFS = (50, 60, 70, 80, 90)
+_GRADE_LABELS = (
+    "C (개선 필요)",
+    "C+ (미흡)",
+    "B (보통)",
+    "B+ (양호)",
+    "A (우수)",
+    "A+ (최우수)",
+)
+
+
 def _get_grade(score: int) -> str:
     """점수를 등급으로 변환"""
-    if score >= 90:
-        return "A+ (최우수)"
-    elif score >= 80:
-        return "A (우수)"
-    elif score >= 70:
-        return "B+ (양호)"
-    elif score >= 60:
-        return "B (보통)"
-    elif score >= 50:
-        return "C+ (미흡)"
-    else:
-        return "C (개선 필요)"
+    return _GRADE_LABELS[bisect_right(_GRADE_CUTOFFS, score)]
 
 
 def _validate_plan_quality(plan: DeckPlan) -> None:
     """데이터 풍부한 플랜의 품질 검증 및 점수 평가"""
+    stats = _analyze_plan(plan)
+    slide_count = stats.slide_count
+
     # 기존 검증 로직
-    if len(plan.slides) < 3:
-        logger.warning("슬라이드 수가 너무 적음", actual=len(plan.slides))
+    if slide_count < 3:
+        logger.warning("슬라이드 수가 너무 적음", actual=slide_count)
 
-    if len(plan.slides) > 12:
-        logger.warning("슬라이드 수가 너무 많음", actual=len(plan.slides))
+    if slide_count > 12:
+        logger.warning("슬라이드 수가 너무 많음", actual=slide_count)
 
     # 데이터 풍부도 검증 - 새로운 기준들
-    slides_without_data = [s for s in plan.slides if not s.data_points]
-    if len(slides_without_data) > len(plan.slides) * 0.3:  # 30% 이상이 데이터 없음
+    slides_without_data = slide_count - stats.n_with_data
+    if slides_without_data > slide_count * 0.3:  # 30% 이상이 데이터 없음
         logger.warning(
-            "데이터 포인트가 부족한 슬라이드가 많음", count=len(slides_without_data)
+            "데이터 포인트가 부족한 슬라이드가 많음", count=slides_without_data
         )
 
-    slides_without_insights = [s for s in plan.slides if not s.expert_insights]
-    if (
-        len(slides_without_insights) > len(plan.slides) * 0.4
-    ):  # 40% 이상이 인사이트 없음
+    slides_without_insights = slide_count - stats.n_with_insights
+    if slides_without_insights > slide_count * 0.4:  # 40% 이상이 인사이트 없음
         logger.warning(
             "전문가 인사이트가 부족한 슬라이드가 많음",
-            count=len(slides_without_insights),
+            count=slides_without_insights,
         )
 
-    slides_without_quant = [s for s in plan.slides if not s.quantitative_details]
-    if (
-        len(slides_without_quant) > len(plan.slides) * 0.5
-    ):  # 50% 이상이 정량 데이터 없음
+    slides_without_quant = slide_count - stats.n_with_quant
+    if slides_without_quant > slide_count * 0.5:  # 50% 이상이 정량 데이터 없음
         logger.warning(
-            "정량적 세부사항이 부족한 슬라이드가 많음", count=len(slides_without_quant)
+            "정량적 세부사항이 부족한 슬라이드가 많음", count=slides_without_quant
         )
 
-    empty_slides = [s for s in plan.slides if not s.key_points]
+    empty_slides = slide_count - stats.n_with_points
     if empty_slides:
-        logger.warning("키 포인트가 비어있는 슬라이드 발견", count=len(empty_slides))
-
-    duplicate_ids = []
-    seen_ids = set()
-    for slide in plan.slides:
-        if slide.slide_id in seen_ids:
-            duplicate_ids.append(slide.slide_id)
-        seen_ids.add(slide.slide_id)
-
-    if duplicate_ids:
-        logger.warning("중복된 슬라이드 번호 발견", duplicates=duplicate_ids)
+        logger.warning("키 포인트가 비어있는 슬라이드 발견", count=empty_slides)
 
-    # 데이터 풍부도 통계
-    total_data_points = sum(len(s.data_points) for s in plan.slides)
-    total_insights = sum(len(s.expert_insights) for s in plan.slides)
-    total_facts = sum(len(s.supporting_facts) for s in plan.slides)
-    total_quant = sum(len(s.quantitative_details) for s in plan.slides)
+    if stats.duplicate_ids:
+        logger.warning("중복된 슬라이드 번호 발견", duplicates=stats.duplicate_ids)
 
     # 품질 점수 계산 및 로깅
-    score_info = _calculate_plan_score(plan)
+    score_info = _calculate_plan_score(plan, stats)
     grade = _get_grade(score_info["total"])
 
     logger.info(
@@ -267,8 +307,8 @@ def _validate_plan_quality(plan: DeckPlan) -> None:
         내용점수=f"{score_info['content']}/35",
         데이터풍부도=f"{score_info['data_richness']}/25",
         명확성점수=f"{score_info['clarity']}/15",
-        총데이터포인트=total_data_points,
-        총인사이트=total_insights,
-        총팩트=total_facts,
-        총정량데이터=total_quant,
+        총데이터포인트=stats.total_data_points,
+        총인사이트=stats.total_insights,
+        총팩트=stats.total_facts,
+        총정량데이터=stats.total_quant,
     )
@@ -3,6 +3,15 @@ This file contains a collection of expert personas for the deck planning phase.
 Each persona uses a common template but with different descriptions and requirements.
 """
 
+from __future__ import annotations
+
+from string import Formatter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Runtime import would be circular: app.models.config imports this module
+    from app.models.config import DeckGenerationConfig
+
 # Common template that all personas will use
 COMMON_PROMPT_TEMPLATE = """
 {persona_description}
@@ -216,3 +225,43 @@ AVAILABLE_PROMPTS = {
     "PRODUCT_MANAGER": PRODUCT_MANAGER,
     "CONSULTANT_ADVISOR": CONSULTANT_ADVISOR,
 }
+
+
+def _split_basic_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Split a basic template once into (literal, field_name) segments"""
+    segments = []
+    for literal, field_name, spec, conversion in Formatter().parse(template):
+        if spec or conversion:
+            raise ValueError(
+                f"Basic prompt field {field_name!r} uses a format spec or conversion"
+            )
+        segments.append((literal, field_name))
+    return tuple(segments)
+
+
+# Basic templates pre-split at import; filling one is a single join
+_BASIC_PROMPT_SEGMENTS = {
+    key: _split_basic_template(template) for key, template in AVAILABLE_PROMPTS.items()
+}
+
+
+def generate_basic_prompt(
+    persona_key: str, prompt: str, config: DeckGenerationConfig
+) -> str:
+    """Fill a basic persona template with the user prompt and config values"""
+    values = {
+        "prompt": prompt,
+        "persona": config.persona,
+        "min_slides": config.min_slides,
+        "max_slides": config.max_slides,
+        "include_data_points": config.include_data_points,
+        "include_expert_insights": config.include_expert_insights,
+        "generation_mode": config.generation_mode,
+        "style_preferences": config.style_preferences,
+    }
+    parts = []
+    for literal, field_name in _BASIC_PROMPT_SEGMENTS[persona_key]:
+        parts.append(literal)
+        if field_name is not None:
+            parts.append(str(values[field_name]))
+    return "".join(parts)
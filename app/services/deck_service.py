@@ -7,6 +7,7 @@ It transforms between request/response models and database models.
 
 import asyncio
 import time
+import weakref
 from datetime import datetime
 from uuid import UUID, uuid4
 
@@ -36,6 +37,22 @@ from app.services.content_creation import write_content
 from app.services.deck_planning import plan_deck
 from app.services.models import Slide
 
+# Shared by every DeckService so DECKFLOW_MAX_DECKS bounds generations process-wide;
+# keyed by event loop because a semaphore can only be awaited on the loop it bound to
+_deck_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+
+def _get_deck_semaphore() -> asyncio.Semaphore:
+    """Return the running loop's deck generation semaphore, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    semaphore = _deck_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(1, settings.max_decks))
+        _deck_semaphores[loop] = semaphore
+    return semaphore
+
 
 class DeckService:
     """Service for deck-related business operations"""
@@ -329,8 +346,8 @@ class DeckService:
         if config is None:
             config = DeckGenerationConfig()
 
-        # Initialize concurrency control
-        deck_semaphore = asyncio.Semaphore(max(1, settings.max_decks))
+        # Concurrency control shared with every other in-flight deck
+        deck_semaphore = _get_deck_semaphore()
 
         # Enhance prompt with file content if provided
         enhanced_prompt = self._enhance_prompt_with_files(
@@ -345,58 +362,61 @@ class DeckService:
                 else:
                     progress_callback(step, progress)
 
-        # Start generation process
-        start_time = time.time()
-        active_deck_generations.inc()
-
         logger.info("🎯 [GENERATE_DECK] Starting deck generation", deck_id=str(deck_id))
 
         try:
             async with deck_semaphore:
-                # Check for cancellation
-                deck = await repo.get_deck(deck_id)
-                if deck and deck.get("status") == DeckStatus.CANCELLED.value:
-                    raise Exception("Deck generation was cancelled")
-
-                # Step 1: Plan deck
-                await update_progress("Planning presentation structure...", 30, status=DeckStatus.PLANNING.value)
-                deck_plan = await plan_deck(enhanced_prompt, llm, config)
-
-                # Step 2: Initialize deck data
-                await update_progress("Initializing deck data...", 40, status=DeckStatus.PLANNING.value)
-                deck_data = {
-                    "id": str(deck_id),
-                    "deck_title": deck_plan.deck_title,
-                    "goal": deck_plan.goal.value,
-                    "audience": deck_plan.audience,
-                    "core_message": deck_plan.core_message,
-                    "color_theme": deck_plan.color_theme.value,
-                    "status": DeckStatus.PLANNING.value,
-                    "slides": [],
-                    "created_at": datetime.now(),
-                }
-                await repo.save_deck(deck_id, deck_data)
-
-                # Step 3: Generate slides
-                slides = await self._generate_all_slides(
-                    deck_plan, llm, update_progress, repo, deck_id, config
-                )
-
-                # Step 4: Finalize deck
-                await self._finalize_deck(
-                    deck_data, slides, repo, deck_id, update_progress
-                )
-
-                # Record metrics
-                duration = time.time() - start_time
-                deck_generation_duration_seconds.observe(duration)
-                deck_generation_total.labels(status=DeckStatus.COMPLETED.value).inc()
-                slide_generation_total.inc(len(slides))
-
-                logger.info(
-                    "🎉 [GENERATE_DECK] Generation completed", deck_id=str(deck_id)
-                )
-                return str(deck_id)
+                # Start generation process once a slot is free, so queued
+                # decks are neither counted as active nor timed
+                start_time = time.perf_counter()
+                active_deck_generations.inc()
+                try:
+                    # Check for cancellation
+                    deck = await repo.get_deck(deck_id)
+                    if deck and deck.get("status") == DeckStatus.CANCELLED.value:
+                        raise Exception("Deck generation was cancelled")
+
+                    # Step 1: Plan deck
+                    await update_progress("Planning presentation structure...", 30, status=DeckStatus.PLANNING.value)
+                    deck_plan = await plan_deck(enhanced_prompt, llm, config)
+
+                    # Step 2: Initialize deck data
+                    await update_progress("Initializing deck data...", 40, status=DeckStatus.PLANNING.value)
+                    deck_data = {
+                        "id": str(deck_id),
+                        "deck_title": deck_plan.deck_title,
+                        "goal": deck_plan.goal.value,
+                        "audience": deck_plan.audience,
+                        "core_message": deck_plan.core_message,
+                        "color_theme": deck_plan.color_theme.value,
+                        "status": DeckStatus.PLANNING.value,
+                        "slides": [],
+                        "created_at": datetime.now(),
+                    }
+                    await repo.save_deck(deck_id, deck_data)
+
+                    # Step 3: Generate slides
+                    slides = await self._generate_all_slides(
+                        deck_plan, llm, update_progress, repo, deck_id, config
+                    )
+
+                    # Step 4: Finalize deck
+                    await self._finalize_deck(
+                        deck_data, slides, repo, deck_id, update_progress
+                    )
+
+                    # Record metrics
+                    duration = time.perf_counter() - start_time
+                    deck_generation_duration_seconds.observe(duration)
+                    deck_generation_total.labels(status=DeckStatus.COMPLETED.value).inc()
+                    slide_generation_total.inc(len(slides))
+
+                    logger.info(
+                        "🎉 [GENERATE_DECK] Generation completed", deck_id=str(deck_id)
+                    )
+                    return str(deck_id)
+                finally:
+                    active_deck_generations.dec()
 
         except Exception as e:
             # Handle errors
@@ -408,8 +428,6 @@ class DeckService:
                 error=str(e),
             )
             raise e
-        finally:
-            active_deck_generations.dec()
 
     def _enhance_prompt_with_files(self, prompt: str, files, deck_id, logger) -> str:
         """Enhance prompt with file contents if provided"""
@@ -472,16 +490,18 @@ Please create a detailed presentation based on these files."""
             slide_info = slide_plan.model_dump()
             slide_title = slide_info.get("slide_title", "Untitled")
 
-            # Check for cancellation
-            deck = await repo.get_deck(deck_id)
-            if deck and deck.get("status") == DeckStatus.CANCELLED.value:
-                raise Exception("Generation cancelled")
-
-            # Generate content
             async with slide_semaphore:
+                # Check for cancellation once a slot frees up, right before
+                # paying for the LLM call
+                deck = await repo.get_deck(deck_id)
+                if deck and deck.get("status") == DeckStatus.CANCELLED.value:
+                    raise Exception("Generation cancelled")
+
+                # Generate content
                 content = await write_content(slide_info, deck_context, llm)
 
-            slide = Slide(order=i + 1, content=content, plan=slide_info)
+            # Both parts come from validated models; skip re-validating the dict
+            slide = Slide.model_construct(order=i + 1, content=content, plan=slide_info)
 
             # Update progress
             async with progress_lock:
@@ -27,7 +27,7 @@ async def modify_slide(
         repo: Repository instance
         progress_callback: 진행상황 콜백 함수
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     async def update_progress(step: str, progress: int):
         """Internal progress updater"""
@@ -145,7 +145,7 @@ async def modify_slide(
 
         await update_progress("Slide modification completed", 100)
 
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         logger.info(
             "✅ [MODIFY_SLIDE] 슬라이드 수정 완료",
             deck_id=str(deck_id),
@@ -0,0 +1,172 @@
+"""Tests for the structured-output cache in the LangChain LLM adapter."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from app.adapter.llm.langchain_client import LangchainLLM
+
+
+class Answer(BaseModel):
+    text: str
+    tags: list[str] = []
+
+
+def _answer_for(messages) -> Answer:
+    return Answer(text=messages[0].content)
+
+
+@pytest.fixture
+def structured_chain():
+    """Stub for the chain returned by with_structured_output()."""
+    chain = MagicMock()
+    chain.ainvoke = AsyncMock(side_effect=_answer_for)
+    return chain
+
+
+@pytest.fixture
+def client(monkeypatch, structured_chain):
+    """LangchainLLM with a small cache and the model call stubbed out."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    llm = LangchainLLM(model="test-model", structured_cache_size=2)
+    llm.llm = MagicMock()
+    llm.llm.with_structured_output.return_value = structured_chain
+    return llm
+
+
+class TestStructuredCache:
+    """Tests for the in-process LRU of structured results."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_llm(self, client, structured_chain):
+        """Test that a repeated prompt is served from the cache."""
+        first = await client.generate_structured("prompt a", Answer)
+        second = await client.generate_structured("prompt a", Answer)
+
+        assert first == second == Answer(text="prompt a")
+        assert structured_chain.ainvoke.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self, client, structured_chain):
+        """Test that the oldest entry is dropped once the size limit is hit."""
+        await client.generate_structured("prompt a", Answer)
+        await client.generate_structured("prompt b", Answer)
+        await client.generate_structured("prompt a", Answer)  # a is now most recent
+        await client.generate_structured("prompt c", Answer)  # evicts b
+        assert structured_chain.ainvoke.await_count == 3
+
+        await client.generate_structured("prompt a", Answer)
+        assert structured_chain.ainvoke.await_count == 3
+
+        await client.generate_structured("prompt b", Answer)
+        assert structured_chain.ainvoke.await_count == 4
+        assert len(client._structured_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_result_is_a_deep_copy(self, client):
+        """Test that mutating a returned model does not change the cache."""
+        first = await client.generate_structured("prompt a", Answer)
+        first.tags.append("mutated")
+
+        second = await client.generate_structured("prompt a", Answer)
+
+        assert second is not first
+        assert second.tags == []
+
+    @pytest.mark.asyncio
+    async def test_failed_call_is_not_cached(self, client, structured_chain):
+        """Test that an error is raised and the next call retries the LLM."""
+        structured_chain.ainvoke.side_effect = [
+            RuntimeError("LLM Error"),
+            Answer(text="prompt a"),
+        ]
+
+        with pytest.raises(RuntimeError, match="LLM Error"):
+            await client.generate_structured("prompt a", Answer)
+
+        result = await client.generate_structured("prompt a", Answer)
+
+        assert result == Answer(text="prompt a")
+        assert structured_chain.ainvoke.await_count == 2
+
+
+class TestStructuredSingleFlight:
+    """Tests for sharing one in-flight call between identical requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_invocation(
+        self, client, structured_chain
+    ):
+        """Test that concurrent identical prompts hit the LLM once."""
+        release = asyncio.Event()
+
+        async def slow_answer(messages):
+            await release.wait()
+            return _answer_for(messages)
+
+        structured_chain.ainvoke.side_effect = slow_answer
+
+        calls = asyncio.gather(
+            *(client.generate_structured("prompt a", Answer) for _ in range(3))
+        )
+        await asyncio.sleep(0)
+        release.set()
+        results = await calls
+
+        assert structured_chain.ainvoke.await_count == 1
+        assert all(result == Answer(text="prompt a") for result in results)
+        assert len({id(result) for result in results}) == 3
+        assert client._structured_inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_shared_call_error_reaches_every_waiter(
+        self, client, structured_chain
+    ):
+        """Test that a failed shared call raises in every concurrent caller."""
+        release = asyncio.Event()
+
+        async def failing_answer(messages):
+            await release.wait()
+            raise RuntimeError("LLM Error")
+
+        structured_chain.ainvoke.side_effect = failing_answer
+
+        calls = asyncio.gather(
+            *(client.generate_structured("prompt a", Answer) for _ in range(3)),
+            return_exceptions=True,
+        )
+        await asyncio.sleep(0)
+        release.set()
+        results = await calls
+
+        assert structured_chain.ainvoke.await_count == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert client._structured_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_shared_call_error_is_logged_after_waiters_cancel(
+        self, client, structured_chain, monkeypatch
+    ):
+        """Test that the shared call's error is retrieved once nobody awaits it."""
+        release = asyncio.Event()
+
+        async def failing_answer(messages):
+            await release.wait()
+            raise RuntimeError("LLM Error")
+
+        structured_chain.ainvoke.side_effect = failing_answer
+        logger = MagicMock()
+        monkeypatch.setattr("app.adapter.llm.langchain_client.logger", logger)
+
+        waiter = asyncio.ensure_future(client.generate_structured("prompt a", Answer))
+        await asyncio.sleep(0)
+        shared = next(iter(client._structured_inflight.values()))
+        waiter.cancel()
+        release.set()
+        with pytest.raises(RuntimeError, match="LLM Error"):
+            await shared
+
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args.kwargs["error"] == "LLM Error"
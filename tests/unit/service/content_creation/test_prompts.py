@@ -0,0 +1,24 @@
+"""Tests for layout prompt pre-parsing."""
+
+import pytest
+
+from app.services.content_creation.prompts import _compile_prompt
+
+
+class TestCompilePrompt:
+    """Tests for splitting layout templates into segments."""
+
+    def test_compile_prompt_splits_fields(self):
+        """Test that literals and field names are kept in order."""
+        segments = _compile_prompt("Use {persona_preference} spacing: {slide_data}")
+
+        assert segments == (
+            ("Use ", "persona_preference"),
+            (" spacing: ", "slide_data"),
+        )
+
+    @pytest.mark.parametrize("template", ["{slide_data!r}", "{slide_data:>10}"])
+    def test_compile_prompt_rejects_spec_and_conversion(self, template):
+        """Test that templates str.format would render differently are rejected."""
+        with pytest.raises(ValueError, match="slide_data"):
+            _compile_prompt(template)
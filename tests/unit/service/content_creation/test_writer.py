@@ -1,9 +1,15 @@
 """Tests for content creation writer logic."""
 
+import asyncio
+from unittest.mock import MagicMock
+
 import pytest
 
+from app.core.config import settings
 from app.services.content_creation.models import SlideContent
 from app.services.content_creation.writer import (
+    _background_validations,
+    _validate_body_content,
     _validate_slide_content,
     write_content,
 )
@@ -137,6 +143,32 @@ class TestWriteContent:
         prompt = call_args[0][0]
         assert "Test" in prompt  # Should use provided values
 
+    @pytest.mark.asyncio
+    async def test_write_content_validates_in_background(
+        self, mock_llm, sample_slide_content
+    ):
+        """Validation runs as a tracked background task after returning."""
+        mock_llm.generate_structured.return_value = sample_slide_content
+
+        await write_content({"slide_title": "Test"}, {"deck_title": "Test"}, mock_llm)
+
+        assert _background_validations
+        await asyncio.gather(*_background_validations)
+        await asyncio.sleep(0)  # let done-callbacks release the tasks
+        assert not _background_validations
+
+    @pytest.mark.asyncio
+    async def test_write_content_skips_validation_when_disabled(
+        self, mock_llm, sample_slide_content, monkeypatch
+    ):
+        """DECKFLOW_VALIDATE_SLIDES=0 turns the advisory validation off."""
+        monkeypatch.setattr(settings, "validate_slides", False)
+        mock_llm.generate_structured.return_value = sample_slide_content
+
+        await write_content({"slide_title": "Test"}, {"deck_title": "Test"}, mock_llm)
+
+        assert not _background_validations
+
 
 # Now using real CSS builder from tests.builders
 
@@ -223,3 +255,65 @@ class TestValidateSlideContent:
         warnings = _validate_slide_content(bad_content, "Test Slide")
         # Should warn about requirements not met (16:9 aspect ratio, etc.)
         assert any("슬라이드 요구사항 체크 실패" in w for w in warnings)
+
+    def test_validate_slide_content_spacing_checks(self):
+        """Test that oversized spacing/height classes are reported."""
+        content = SlideContent(
+            html_content=(
+                '<!DOCTYPE html><html><body class="overflow-hidden h-full">'
+                '<div class="py-16 h-96" style="aspect-ratio: 16/9">Body</div>'
+                "</body></html>"
+            )
+        )
+
+        warnings = _validate_slide_content(content, "Test Slide")
+        failed = next(w for w in warnings if "슬라이드 요구사항 체크 실패" in w)
+        assert "no large padding" in failed
+        assert "no fixed heights" in failed
+        assert "no large margins" not in failed
+        assert "16:9 aspect ratio" not in failed
+
+    def test_validate_slide_content_ignores_hyphenated_classes(self):
+        """Hyphens in class names are not counted as list items."""
+        content = SlideContent(
+            html_content=(
+                '<!DOCTYPE html><html><body class="d-flex align-items-center">'
+                '<div class="text-center fw-bold mb-2 px-3 py-2 col-md-6">'
+                "<ul><li>One</li><li>Two</li></ul>\n- Three\n</div>"
+                "</body></html>"
+            )
+        )
+
+        warnings = _validate_slide_content(content, "Test Slide")
+
+        assert not any("too many list items" in w for w in warnings)
+
+
+class TestValidateBodyContent:
+    """Tests for body extraction and forbidden-element stripping."""
+
+    def test_extracts_body_from_full_document(self):
+        """Full documents are reduced to the inner body markup."""
+        html = (
+            "<!DOCTYPE html><HTML><head><title>T</title></head>"
+            '<BODY class="x"><div>Inner</div></BODY></html>'
+        )
+
+        assert _validate_body_content(html, "Test Slide") == "<div>Inner</div>"
+
+    def test_strips_forbidden_elements(self, monkeypatch):
+        """Head-only tags and the Tailwind CDN script are removed."""
+        logger = MagicMock()
+        monkeypatch.setattr("app.services.content_creation.writer.logger", logger)
+        body = (
+            '<META charset="utf-8"><div class="p-4">Keep</div>'
+            '<script src="https://cdn.tailwindcss.com"></script>'
+        )
+
+        cleaned = _validate_body_content(body, "Test Slide")
+
+        assert cleaned == '<div class="p-4">Keep</div></script>'
+        assert logger.warning.call_args.kwargs["elements"] == [
+            "<meta",
+            '<script src="https://cdn.tailwindcss.com"',
+        ]
@@ -1,5 +1,7 @@
 """Tests for deck planning logic."""
 
+import re
+
 import pytest
 
 from app.models.enums import ColorPreference
@@ -70,6 +72,28 @@ class TestPlanDeck:
             or "presentation strategist" in prompt.lower()
         )
 
+    @pytest.mark.asyncio
+    async def test_plan_deck_falls_back_to_basic_prompt(
+        self, mock_llm, sample_deck_plan, monkeypatch
+    ):
+        """Test that the basic template is used when prompt generation fails."""
+        mock_llm.generate_structured.return_value = sample_deck_plan
+
+        def broken_prompt(*args, **kwargs):
+            raise RuntimeError("template error")
+
+        monkeypatch.setattr(
+            "app.services.deck_planning.planner.generate_persona_prompt",
+            broken_prompt,
+        )
+
+        await plan_deck("Create AI presentation", mock_llm)
+
+        prompt = mock_llm.generate_structured.call_args[0][0]
+        assert "Create AI presentation" in prompt
+        assert re.search(r"\{\w+\}", prompt) is None
+        assert "Slide count: 3 to 10 slides" in prompt
+
 
 class TestPlanScoring:
     """Tests for plan quality scoring system."""
@@ -0,0 +1,70 @@
+"""Tests for deck generation concurrency in the deck service."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.config import settings
+from app.services import deck_service
+from app.services.deck_service import DeckService
+
+
+class TestDeckConcurrency:
+    """Tests for the shared deck generation limit."""
+
+    @pytest.mark.asyncio
+    async def test_generations_share_max_decks_across_services(
+        self, mock_llm, mock_repo, monkeypatch
+    ):
+        """Test that decks from separate services never exceed max_decks."""
+        monkeypatch.setattr(settings, "max_decks", 2)
+        running = 0
+        peak = 0
+        gauge_peak = 0
+        gauge_before = _active_generations()
+
+        async def fake_plan_deck(prompt, llm, config):
+            nonlocal running, peak, gauge_peak
+            running += 1
+            peak = max(peak, running)
+            gauge_peak = max(gauge_peak, _active_generations() - gauge_before)
+            await asyncio.sleep(0.01)
+            running -= 1
+            raise RuntimeError("stop after planning")
+
+        monkeypatch.setattr(deck_service, "plan_deck", fake_plan_deck)
+        services = [DeckService(mock_repo, mock_llm) for _ in range(2)]
+
+        results = await asyncio.gather(
+            *(
+                service._generate_deck("Prompt", mock_llm, mock_repo, deck_id=uuid4())
+                for service in services
+                for _ in range(3)
+            ),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert peak == 2
+        assert gauge_peak == 2
+        assert _active_generations() == gauge_before
+
+    @pytest.mark.asyncio
+    async def test_each_event_loop_gets_its_own_semaphore(self):
+        """Test that a semaphore bound to another loop is not reused."""
+        semaphore = deck_service._get_deck_semaphore()
+
+        other = await asyncio.to_thread(lambda: asyncio.run(_semaphore_in_new_loop()))
+
+        assert deck_service._get_deck_semaphore() is semaphore
+        assert other is not semaphore
+
+
+def _active_generations() -> float:
+    return REGISTRY.get_sample_value("deckflow_active_deck_generations")
+
+
+async def _semaphore_in_new_loop():
+    return deck_service._get_deck_semaphore()